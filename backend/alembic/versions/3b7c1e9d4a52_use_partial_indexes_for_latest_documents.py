@@ -0,0 +1,30 @@
+"""Use partial indexes for latest documents
+
+Revision ID: 3b7c1e9d4a52
+Revises: 02945996ce3d
+Create Date: 2026-10-14 10:12:41.208314
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7c1e9d4a52'
+down_revision = '02945996ce3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_latest_document', table_name='documents')
+    op.create_index('idx_latest_document_true', 'documents', ['document_type', 'project_id', 'experiment_id'], unique=False, postgresql_where=sa.text('is_latest'))
+    op.create_index('idx_latest_experiment_true', 'documents', ['document_type', 'experiment_id'], unique=False, postgresql_where=sa.text('is_latest AND experiment_id IS NOT NULL'))
+    op.create_index('idx_document_file_hash', 'documents', ['file_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_document_file_hash', table_name='documents')
+    op.drop_index('idx_latest_experiment_true', table_name='documents')
+    op.drop_index('idx_latest_document_true', table_name='documents')
+    op.create_index('idx_latest_document', 'documents', ['document_type', 'project_id', 'experiment_id', 'is_latest'], unique=False)
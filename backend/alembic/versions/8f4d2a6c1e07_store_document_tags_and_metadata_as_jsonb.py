@@ -0,0 +1,31 @@
+"""Store document tags and metadata as JSONB
+
+Revision ID: 8f4d2a6c1e07
+Revises: 3b7c1e9d4a52
+Create Date: 2026-10-14 11:03:17.542961
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8f4d2a6c1e07'
+down_revision = '3b7c1e9d4a52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('documents', 'tags', type_=postgresql.JSONB(), existing_type=sa.JSON(), postgresql_using='tags::jsonb')
+    op.alter_column('documents', 'extra_metadata', type_=postgresql.JSONB(), existing_type=sa.JSON(), postgresql_using='extra_metadata::jsonb')
+    op.create_index('idx_documents_tags_gin', 'documents', ['tags'], unique=False, postgresql_using='gin')
+    op.create_index('idx_documents_meta_gin', 'documents', ['extra_metadata'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_documents_meta_gin', table_name='documents')
+    op.drop_index('idx_documents_tags_gin', table_name='documents')
+    op.alter_column('documents', 'extra_metadata', type_=sa.JSON(), existing_type=postgresql.JSONB(), postgresql_using='extra_metadata::json')
+    op.alter_column('documents', 'tags', type_=sa.JSON(), existing_type=postgresql.JSONB(), postgresql_using='tags::json')
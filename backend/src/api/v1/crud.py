@@ -0,0 +1,223 @@
+"""Shared CRUD helpers for resource endpoints."""
+import hashlib
+import inspect
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session
+
+from src.api.v1.endpoints.auth import get_db
+
+DETAIL_CACHE_CONTROL = "private, max-age=30"
+CRUD_ROUTES = ("create", "list", "read", "update", "delete")
+
+
+def list_response(adapter: TypeAdapter, rows: list, schema=None) -> Response:
+    """Serialize ORM rows through a list TypeAdapter built once at import.
+
+    Bypasses FastAPI's per-request response_model handling; routes keep the
+    schema in ``responses`` so it still appears in the OpenAPI docs. Passing
+    ``schema`` marks the rows as trusted: they are built with its
+    ``from_orm_fast`` instead of being validated. The adapter encodes the
+    list to JSON bytes in pydantic-core, with no intermediate Python dicts.
+    """
+    if schema is not None:
+        items = [schema.from_orm_fast(row) for row in rows]
+    else:
+        items = adapter.validate_python(rows)
+    return Response(adapter.dump_json(items), media_type="application/json")
+
+
+def make_etag(obj) -> str:
+    """Build a weak ETag from a row's ID and last update time."""
+    digest = hashlib.blake2b(
+        f"{obj.id}:{obj.updated_at.timestamp()}".encode(), digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison.
+
+    Per RFC 9110 the header is ``*`` or a comma-separated list of entity tags,
+    and If-None-Match compares them ignoring any ``W/`` prefix.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque
+        for tag in if_none_match.split(",")
+    )
+
+
+def check_etag(request: Request, response: Response, obj) -> Optional[Response]:
+    """Return a 304 if the client's copy of obj is current, else tag the response."""
+    etag = make_etag(obj)
+    headers = {"ETag": etag, "Cache-Control": DETAIL_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+def _filter_dependency(filters: Dict[str, Any]):
+    """Build a dependency exposing each filter column as an optional query param.
+
+    ``filters`` maps a query parameter name to a model column, or to a
+    ``(column, description)`` tuple when the generated description is unclear.
+    """
+    columns = {}
+    params = []
+    for key, spec in filters.items():
+        column, description = spec if isinstance(spec, tuple) else (spec, None)
+        if description is None:
+            description = "Filter by " + key.replace("_id", " ID").replace("_", " ")
+        columns[key] = column
+        params.append(inspect.Parameter(
+            key,
+            inspect.Parameter.KEYWORD_ONLY,
+            default=Query(None, description=description),
+            annotation=Optional[column.type.python_type],
+        ))
+
+    def get_filters(**values) -> list:
+        return [columns[key] == value for key, value in values.items() if value is not None]
+
+    get_filters.__signature__ = inspect.Signature(params)
+    return get_filters
+
+
+def crud_router(
+    model,
+    create_schema,
+    update_schema,
+    read_schema,
+    *,
+    name: str,
+    filters: Optional[Dict[str, Any]] = None,
+    routes: Sequence[str] = CRUD_ROUTES,
+) -> APIRouter:
+    """Build a router with the standard create/list/read/update/delete routes.
+
+    Statements are built once per model here rather than per request, so every
+    call hands SQLAlchemy the same statement object and only the bound ID
+    changes. ``routes`` selects which routes to generate, letting a module
+    replace some of them with its own handlers.
+    """
+    router = APIRouter()
+    label = name.capitalize()
+    article = "an" if name[0] in "aeiou" else "a"
+    id_path = f"/{{{name}_id}}"
+
+    list_adapter = TypeAdapter(List[read_schema])
+    get_filters = _filter_dependency(filters or {})
+    select_by_id = select(model).where(model.id == bindparam("obj_id"))
+    update_by_id = update(model).where(model.id == bindparam("obj_id")).returning(model)
+    delete_by_id = delete(model).where(model.id == bindparam("obj_id")).returning(model.id)
+    # Core UPDATE rejects unknown keys, so PATCH fields without a column are dropped
+    column_names = frozenset(model.__table__.columns.keys())
+
+    def obj_id_param():
+        return Path(alias=f"{name}_id")
+
+    def create_item(item: create_schema, db: Session = Depends(get_db)):
+        db_item = model(**item.model_dump())
+        db.add(db_item)
+        db.commit()
+        db.refresh(db_item)
+        return db_item
+
+    def read_items(
+        skip: int = 0,
+        limit: int = 100,
+        criteria: list = Depends(get_filters),
+        db: Session = Depends(get_db)
+    ):
+        query = db.query(model)
+        if criteria:
+            query = query.filter(*criteria)
+
+        items = query.offset(skip).limit(limit).all()
+        return list_response(list_adapter, items, read_schema)
+
+    def read_item(
+        request: Request,
+        response: Response,
+        obj_id: int = obj_id_param(),
+        db: Session = Depends(get_db)
+    ):
+        item = db.scalar(select_by_id, {"obj_id": obj_id})
+        if item is None:
+            raise HTTPException(status_code=404, detail=f"{label} not found")
+
+        not_modified = check_etag(request, response, item)
+        if not_modified is not None:
+            return not_modified
+        return item
+
+    def update_item(
+        item_update: update_schema,
+        obj_id: int = obj_id_param(),
+        db: Session = Depends(get_db)
+    ):
+        values = {
+            key: value
+            for key, value in item_update.model_dump(exclude_unset=True).items()
+            if key in column_names
+        }
+        if not values:
+            # Nothing to change: skip the write so updated_at and the ETag hold
+            item = db.scalar(select_by_id, {"obj_id": obj_id})
+            if item is None:
+                raise HTTPException(status_code=404, detail=f"{label} not found")
+            return item
+
+        stmt = update_by_id.values(**values)
+        item = db.execute(stmt, {"obj_id": obj_id}).scalar_one_or_none()
+        if item is None:
+            raise HTTPException(status_code=404, detail=f"{label} not found")
+
+        db.commit()
+        return item
+
+    def delete_item(obj_id: int = obj_id_param(), db: Session = Depends(get_db)):
+        deleted_id = db.scalar(delete_by_id, {"obj_id": obj_id})
+        if deleted_id is None:
+            raise HTTPException(status_code=404, detail=f"{label} not found")
+
+        db.commit()
+        return {"detail": f"{label} deleted successfully"}
+
+    route_table = {
+        "create": (create_item, "/", "POST", f"create_{name}",
+                   f"Create a new {name}.", {"response_model": read_schema}),
+        "list": (read_items, "/", "GET", f"read_{name}s",
+                 f"Get list of {name}s with optional filtering.",
+                 {"response_model": None,
+                  "responses": {200: {"model": List[read_schema]}}}),
+        "read": (read_item, id_path, "GET", f"read_{name}",
+                 f"Get a specific {name} by ID.", {"response_model": read_schema}),
+        "update": (update_item, id_path, "PATCH", f"update_{name}",
+                   f"Update {article} {name}.", {"response_model": read_schema}),
+        "delete": (delete_item, id_path, "DELETE", f"delete_{name}",
+                   f"Delete {article} {name}.", {}),
+    }
+    for route in routes:
+        endpoint, path, method, route_name, description, extra = route_table[route]
+        router.add_api_route(
+            path,
+            endpoint,
+            methods=[method],
+            name=route_name,
+            description=description,
+            **extra,
+        )
+
+    return router
@@ -9,12 +9,20 @@ from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File,
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
+from src.api.v1.crud import list_response
 from src.api.v1.endpoints.auth import get_db, get_current_user
 from src.models.document import Document as DocumentModel
+from src.models.experiment import Experiment as ExperimentModel
+from src.models.project import Project as ProjectModel
 from src.models.user import User
-from src.schemas.document import Document, DocumentCreate, DocumentUpdate, DocumentUploadResponse, DocumentVersion
+from src.schemas.document import (
+    Document, DocumentCreate, DocumentListItem, DocumentUpdate, DocumentUploadResponse, DocumentVersion,
+    document_list_adapter, document_version_list_adapter,
+)
 from src.knowledge_graph.service import knowledge_graph
-from src.knowledge_graph.models import DocumentNode, UserNode, RelationType, GraphRelationship
+from src.knowledge_graph.models import (
+    DocumentNode, ExperimentNode, ProjectNode, UserNode, RelationType, GraphRelationship,
+)
 
 router = APIRouter()
 
@@ -132,7 +140,6 @@ async def upload_document(
             file_type=file_extension,
             document_type=document_type
         )
-        knowledge_graph.create_node(doc_node)
         
         # Create user node
         user_node = UserNode(
@@ -140,14 +147,31 @@ async def upload_document(
             username=current_user.username,
             email=current_user.email
         )
-        knowledge_graph.create_node(user_node)
         
-        # Create relationships
-        knowledge_graph.create_document_uploaded_event(
-            document_id=db_document.id,
-            user_id=current_user.id,
-            project_id=project_id,
-            experiment_id=experiment_id
+        # Parent nodes carry the real names so the merge doesn't overwrite them
+        project_node = experiment_node = None
+        project = db.get(ProjectModel, project_id)
+        if project is not None:
+            project_node = ProjectNode(
+                project_id=project.id,
+                name=project.name,
+                description=project.description
+            )
+        if experiment_id:
+            experiment = db.get(ExperimentModel, experiment_id)
+            if experiment is not None:
+                experiment_node = ExperimentNode(
+                    experiment_id=experiment.id,
+                    name=experiment.name,
+                    experiment_type=experiment.experiment_type
+                )
+        
+        # Every node and relationship goes in one write transaction
+        await knowledge_graph.create_document_uploaded_event(
+            doc_node=doc_node,
+            user_node=user_node,
+            project_node=project_node,
+            experiment_node=experiment_node
         )
     except Exception as e:
         # Log error but don't fail the upload
@@ -249,10 +273,10 @@ async def upload_new_version(
             document_type=new_doc.document_type,
             version_number=new_version
         )
-        knowledge_graph.create_node(new_doc_node)
+        await knowledge_graph.create_node(new_doc_node)
         
         # Create version relationship
-        knowledge_graph.create_relationship(GraphRelationship(
+        await knowledge_graph.create_relationship(GraphRelationship(
             type=RelationType.VERSION_OF,
             source_id=f"document_{new_doc.id}",
             target_id=f"document_{document_id}",
@@ -265,7 +289,7 @@ async def upload_new_version(
     return new_doc
 
 
-@router.get("/{document_id}/versions", response_model=List[DocumentVersion])
+@router.get("/{document_id}/versions", response_model=None, responses={200: {"model": List[DocumentVersion]}})
 def get_document_versions(
     document_id: int,
     current_user: User = Depends(get_current_user),
@@ -285,7 +309,7 @@ def get_document_versions(
         (DocumentModel.id == root_id) | (DocumentModel.parent_document_id == root_id)
     ).order_by(DocumentModel.version_number).all()
     
-    return versions
+    return list_response(document_version_list_adapter, versions, DocumentVersion)
 
 
 @router.get("/{document_id}/versions/{version_number}", response_model=Document)
@@ -391,7 +415,7 @@ def restore_document_version(
     return restored_doc
 
 
-@router.get("/", response_model=List[Document])
+@router.get("/", response_model=None, responses={200: {"model": List[DocumentListItem]}})
 def read_documents(
     skip: int = 0,
     limit: int = 100,
@@ -423,7 +447,7 @@ def read_documents(
         query = query.filter(DocumentModel.is_latest == True)
     
     documents = query.offset(skip).limit(limit).all()
-    return documents
+    return list_response(document_list_adapter, documents, DocumentListItem)
 
 
 @router.get("/{document_id}", response_model=Document)
@@ -472,7 +496,7 @@ def update_document(
     if document is None:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    update_data = document_update.dict(exclude_unset=True)
+    update_data = document_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(document, field, value)
     
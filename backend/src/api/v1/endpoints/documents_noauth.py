@@ -3,14 +3,15 @@ from typing import List
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from src.api.v1.crud import list_response
 from src.api.v1.endpoints.auth import get_db
 from src.models.document import Document as DocumentModel
-from src.schemas.document import Document
+from src.schemas.document import DocumentListItem, document_list_adapter
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[Document])
+@router.get("/", response_model=None, responses={200: {"model": List[DocumentListItem]}})
 def read_documents_noauth(
     skip: int = 0,
     limit: int = 100,
@@ -18,4 +19,4 @@ def read_documents_noauth(
 ):
     """Get list of documents without authentication."""
     documents = db.query(DocumentModel).offset(skip).limit(limit).all()
-    return documents
\ No newline at end of file
+    return list_response(document_list_adapter, documents, DocumentListItem)
\ No newline at end of file
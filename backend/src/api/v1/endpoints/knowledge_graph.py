@@ -6,7 +6,7 @@ from pydantic import BaseModel
 
 from src.api.v1.endpoints.auth import get_current_user
 from src.models.user import User
-from src.knowledge_graph.service import knowledge_graph
+from src.knowledge_graph.service import collect, knowledge_graph
 from src.knowledge_graph.models import (
     GraphNode, GraphRelationship, NodeType, RelationType,
     KnowledgeGraphQuery, GraphPath
@@ -36,6 +36,7 @@ class SearchRequest(BaseModel):
     relationship_type: Optional[RelationType] = None
     properties_filter: Dict[str, Any] = {}
     max_depth: int = 3
+    fields: Optional[List[str]] = None  # Properties to return; all when omitted
 
 
 @router.post("/nodes")
@@ -61,12 +62,11 @@ async def create_node(
             properties=node_request.properties
         )
         
-        success = knowledge_graph.create_node(node)
+        # MERGE always leaves the node in place; False only means nothing changed
+        written = await knowledge_graph.create_node(node)
+        message = "Node created successfully" if written else "Node already up to date"
         
-        if success:
-            return {"message": "Node created successfully", "node_id": node_id}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to create node")
+        return {"message": message, "node_id": node_id}
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -86,7 +86,7 @@ async def create_relationship(
             properties=rel_request.properties
         )
         
-        success = knowledge_graph.create_relationship(relationship)
+        success = await knowledge_graph.create_relationship(relationship)
         
         if success:
             return {"message": "Relationship created successfully"}
@@ -100,10 +100,11 @@ async def create_relationship(
 @router.get("/nodes/{node_id}")
 async def get_node(
     node_id: str,
+    node_type: Optional[NodeType] = Query(None),
     current_user: User = Depends(get_current_user)
 ):
     """Get a node by ID."""
-    node = knowledge_graph.get_node(node_id)
+    node = await knowledge_graph.get_node(node_id, node_type=node_type)
     
     if node:
         return node
@@ -116,15 +117,19 @@ async def get_node_relationships(
     node_id: str,
     relationship_type: Optional[RelationType] = Query(None),
     direction: str = Query("both", regex="^(incoming|outgoing|both)$"),
+    node_type: Optional[NodeType] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
     current_user: User = Depends(get_current_user)
 ):
     """Get relationships for a node."""
     try:
-        relationships = knowledge_graph.get_node_relationships(
+        relationships = await collect(knowledge_graph.get_node_relationships(
             node_id=node_id,
             relationship_type=relationship_type,
-            direction=direction
-        )
+            direction=direction,
+            node_type=node_type,
+            limit=limit
+        ))
         
         return {"relationships": relationships}
         
@@ -140,10 +145,10 @@ async def get_related_nodes(
 ):
     """Get all nodes related to a given node."""
     try:
-        related_nodes = knowledge_graph.get_related_nodes(
+        related_nodes = await collect(knowledge_graph.get_related_nodes(
             node_id=node_id,
             max_depth=max_depth
-        )
+        ))
         
         return {"related_nodes": related_nodes}
         
@@ -162,10 +167,10 @@ async def search_knowledge_graph(
         
         # Full-text search
         if search_request.query_text:
-            results = knowledge_graph.full_text_search(
+            results = await collect(knowledge_graph.full_text_search(
                 query_text=search_request.query_text,
                 node_type=search_request.node_type
-            )
+            ))
         
         # Property-based search
         elif search_request.properties_filter or search_request.node_type:
@@ -174,7 +179,7 @@ async def search_knowledge_graph(
                 properties_filter=search_request.properties_filter,
                 max_depth=search_request.max_depth
             )
-            results = knowledge_graph.search_nodes(query)
+            results = await collect(knowledge_graph.search_nodes(query, fields=search_request.fields))
         
         return {"results": results, "count": len(results)}
         
@@ -187,19 +192,23 @@ async def find_path(
     start_id: str,
     end_id: str,
     max_depth: int = Query(5, ge=1, le=10),
+    start_type: Optional[NodeType] = Query(None),
+    end_type: Optional[NodeType] = Query(None),
     current_user: User = Depends(get_current_user)
 ):
     """Find shortest path between two nodes."""
     try:
-        path = knowledge_graph.find_path(
+        path = await knowledge_graph.find_path(
             start_id=start_id,
             end_id=end_id,
-            max_depth=max_depth
+            max_depth=max_depth,
+            start_type=start_type,
+            end_type=end_type
         )
         
         if path:
             return {
-                "path": path.dict(),
+                "path": path.model_dump(),
                 "length": path.length
             }
         else:
@@ -213,7 +222,7 @@ async def find_path(
 async def knowledge_graph_health():
     """Check Neo4j connection health."""
     try:
-        is_connected = knowledge_graph.db.check_connection()
+        is_connected = await knowledge_graph.db.check_connection()
         
         return {
             "status": "healthy" if is_connected else "unhealthy",
@@ -1,83 +1,16 @@
 """Project endpoints."""
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-
-from src.api.v1.endpoints.auth import get_db
+from src.api.v1.crud import crud_router
 from src.models.project import Project as ProjectModel
 from src.schemas.project import Project, ProjectCreate, ProjectUpdate
 
-router = APIRouter()
-
-
-@router.post("/", response_model=Project)
-def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
-    """Create a new project."""
-    db_project = ProjectModel(**project.dict())
-    db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    return db_project
-
-
-@router.get("/", response_model=List[Project])
-def read_projects(
-    skip: int = 0, 
-    limit: int = 100,
-    status: Optional[str] = Query(None, description="Filter by status"),
-    owner_id: Optional[int] = Query(None, description="Filter by owner ID"),
-    db: Session = Depends(get_db)
-):
-    """Get list of projects with optional filtering."""
-    query = db.query(ProjectModel)
-    
-    if status is not None:
-        query = query.filter(ProjectModel.status == status)
-    
-    if owner_id is not None:
-        query = query.filter(ProjectModel.owner_id == owner_id)
-    
-    projects = query.offset(skip).limit(limit).all()
-    return projects
-
-
-@router.get("/{project_id}", response_model=Project)
-def read_project(project_id: int, db: Session = Depends(get_db)):
-    """Get a specific project by ID."""
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return project
-
-
-@router.patch("/{project_id}", response_model=Project)
-def update_project(
-    project_id: int,
-    project_update: ProjectUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update a project."""
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    update_data = project_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-    
-    db.commit()
-    db.refresh(project)
-    return project
-
-
-@router.delete("/{project_id}")
-def delete_project(project_id: int, db: Session = Depends(get_db)):
-    """Delete a project."""
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    db.delete(project)
-    db.commit()
-    return {"detail": "Project deleted successfully"}
\ No newline at end of file
+router = crud_router(
+    ProjectModel,
+    ProjectCreate,
+    ProjectUpdate,
+    Project,
+    name="project",
+    filters={
+        "status": ProjectModel.status,
+        "owner_id": ProjectModel.owner_id,
+    },
+)
@@ -1,15 +1,25 @@
 """User endpoints."""
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import Depends, HTTPException
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from src.api.v1.crud import crud_router
 from src.api.v1.endpoints.auth import get_db
 from src.core.security import get_password_hash
 from src.models.user import User as UserModel
 from src.schemas.user import User, UserCreate, UserUpdate
 
-router = APIRouter()
+# Create and update need uniqueness checks and password hashing, so they are
+# defined below instead of generated
+router = crud_router(
+    UserModel,
+    UserCreate,
+    UserUpdate,
+    User,
+    name="user",
+    filters={"is_active": (UserModel.is_active, "Filter by active status")},
+    routes=("list", "read", "delete"),
+)
 
 
 @router.post("/", response_model=User)
@@ -40,32 +50,6 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     return db_user
 
 
-@router.get("/", response_model=List[User])
-def read_users(
-    skip: int = 0, 
-    limit: int = 100,
-    is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    db: Session = Depends(get_db)
-):
-    """Get list of users with optional filtering."""
-    query = db.query(UserModel)
-    
-    if is_active is not None:
-        query = query.filter(UserModel.is_active == is_active)
-    
-    users = query.offset(skip).limit(limit).all()
-    return users
-
-
-@router.get("/{user_id}", response_model=User)
-def read_user(user_id: int, db: Session = Depends(get_db)):
-    """Get a specific user."""
-    db_user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if db_user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-    return db_user
-
-
 @router.patch("/{user_id}", response_model=User)
 def update_user(
     user_id: int,
@@ -73,33 +57,27 @@ def update_user(
     db: Session = Depends(get_db)
 ):
     """Update a user."""
-    db_user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if db_user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True)
+    if not update_data:
+        # Nothing to change: skip the write so updated_at and the ETag hold
+        db_user = db.get(UserModel, user_id)
+        if db_user is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return db_user
     
     # Hash password if it's being updated
     if "password" in update_data:
-        hashed_password = get_password_hash(update_data["password"])
-        del update_data["password"]
-        update_data["hashed_password"] = hashed_password
+        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
     
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
-    
-    db.commit()
-    db.refresh(db_user)
-    return db_user
-
-
-@router.delete("/{user_id}")
-def delete_user(user_id: int, db: Session = Depends(get_db)):
-    """Delete a user."""
-    db_user = db.query(UserModel).filter(UserModel.id == user_id).first()
+    stmt = (
+        update(UserModel)
+        .where(UserModel.id == user_id)
+        .values(**update_data)
+        .returning(UserModel)
+    )
+    db_user = db.execute(stmt).scalar_one_or_none()
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     
-    db.delete(db_user)
     db.commit()
-    return {"detail": "User deleted successfully"}
\ No newline at end of file
+    return db_user
@@ -1,10 +1,9 @@
 """Neo4j database connection and session management."""
 import logging
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager
 
-from neo4j import GraphDatabase
-from neo4j.exceptions import ServiceUnavailable
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncGraphDatabase
+from neo4j.exceptions import Neo4jError, ServiceUnavailable
 
 from src.config import settings
 
@@ -15,51 +14,89 @@ class Neo4jConnection:
     """Handle Neo4j database connection."""
     
     def __init__(self):
-        """Initialize Neo4j connection."""
+        """Initialize Neo4j connection.
+        
+        The driver is created lazily by connect() (called from the app
+        lifespan) or on first session use, so importing this module never
+        performs network I/O.
+        """
         self._driver = None
-        self._connect()
     
-    def _connect(self):
+    async def connect(self):
+        """Connect the shared driver if it is not connected yet."""
+        if not self._driver:
+            await self._connect()
+    
+    async def _connect(self):
         """Create Neo4j driver connection."""
         try:
-            self._driver = GraphDatabase.driver(
+            self._driver = AsyncGraphDatabase.driver(
                 settings.NEO4J_URI,
-                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                max_connection_pool_size=settings.NEO4J_POOL_SIZE,
+                connection_acquisition_timeout=settings.NEO4J_ACQUISITION_TIMEOUT,
+                max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+                connection_timeout=settings.NEO4J_CONNECTION_TIMEOUT,
+                keep_alive=True,
             )
             # Verify connectivity
-            self._driver.verify_connectivity()
+            await self._driver.verify_connectivity()
             logger.info("Successfully connected to Neo4j")
         except ServiceUnavailable as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
+            await self._close_driver()
             raise
         except Exception as e:
             logger.error(f"Unexpected error connecting to Neo4j: {e}")
+            await self._close_driver()
             raise
     
-    def close(self):
+    async def _close_driver(self):
+        """Discard a driver that failed to connect so the next call retries."""
+        if self._driver:
+            await self._driver.close()
+            self._driver = None
+    
+    async def close(self):
         """Close Neo4j connection."""
         if self._driver:
-            self._driver.close()
+            await self._driver.close()
+            self._driver = None
             logger.info("Neo4j connection closed")
     
-    @contextmanager
-    def get_session(self):
-        """Get Neo4j session as context manager."""
+    @asynccontextmanager
+    async def get_session(self, access_mode: str = WRITE_ACCESS):
+        """Get Neo4j session as async context manager."""
         if not self._driver:
-            self._connect()
+            await self._connect()
         
-        session = self._driver.session()
+        session = self._driver.session(default_access_mode=access_mode)
         try:
             yield session
         finally:
-            session.close()
+            await session.close()
+    
+    def get_read_session(self):
+        """Get a read session; in a cluster these are routed to replicas."""
+        return self.get_session(READ_ACCESS)
+    
+    def get_write_session(self):
+        """Get a write session, routed to the cluster leader."""
+        return self.get_session(WRITE_ACCESS)
+    
+    async def verify_connectivity(self):
+        """Raise if the driver cannot reach the server."""
+        if not self._driver:
+            await self._connect()
+        else:
+            await self._driver.verify_connectivity()
     
-    def check_connection(self) -> bool:
+    async def check_connection(self) -> bool:
         """Check if Neo4j is connected and responsive."""
         try:
-            with self.get_session() as session:
-                result = session.run("RETURN 1")
-                result.single()
+            async with self.get_read_session() as session:
+                result = await session.run("RETURN 1")
+                await result.single()
                 return True
         except Exception as e:
             logger.error(f"Neo4j health check failed: {e}")
@@ -75,42 +112,40 @@ def get_neo4j_db() -> Neo4jConnection:
     return neo4j_db
 
 
-def init_neo4j_indexes():
-    """Initialize Neo4j indexes and constraints."""
-    with neo4j_db.get_session() as session:
-        try:
-            # Create indexes for better performance
-            indexes = [
-                "CREATE INDEX project_id IF NOT EXISTS FOR (p:Project) ON (p.id)",
-                "CREATE INDEX experiment_id IF NOT EXISTS FOR (e:Experiment) ON (e.id)",
-                "CREATE INDEX document_id IF NOT EXISTS FOR (d:Document) ON (d.id)",
-                "CREATE INDEX user_id IF NOT EXISTS FOR (u:User) ON (u.id)",
-                "CREATE INDEX sample_id IF NOT EXISTS FOR (s:Sample) ON (s.id)",
-                "CREATE INDEX protocol_id IF NOT EXISTS FOR (p:Protocol) ON (p.id)",
-                
-                # Full-text search indexes
-                "CREATE FULLTEXT INDEX document_search IF NOT EXISTS FOR (d:Document) ON EACH [d.title, d.description]",
-                "CREATE FULLTEXT INDEX project_search IF NOT EXISTS FOR (p:Project) ON EACH [p.name, p.description]",
-            ]
-            
-            for index in indexes:
-                session.run(index)
-                logger.info(f"Created index: {index}")
-            
-            # Create constraints
-            constraints = [
-                "CREATE CONSTRAINT project_id_unique IF NOT EXISTS FOR (p:Project) REQUIRE p.id IS UNIQUE",
-                "CREATE CONSTRAINT experiment_id_unique IF NOT EXISTS FOR (e:Experiment) REQUIRE e.id IS UNIQUE",
-                "CREATE CONSTRAINT document_id_unique IF NOT EXISTS FOR (d:Document) REQUIRE d.id IS UNIQUE",
-                "CREATE CONSTRAINT user_id_unique IF NOT EXISTS FOR (u:User) REQUIRE u.id IS UNIQUE",
-                "CREATE CONSTRAINT sample_id_unique IF NOT EXISTS FOR (s:Sample) REQUIRE s.id IS UNIQUE",
-                "CREATE CONSTRAINT protocol_id_unique IF NOT EXISTS FOR (p:Protocol) REQUIRE p.id IS UNIQUE",
-            ]
-            
-            for constraint in constraints:
-                session.run(constraint)
-                logger.info(f"Created constraint: {constraint}")
-                
-        except Exception as e:
-            logger.error(f"Error initializing Neo4j indexes: {e}")
-            raise
\ No newline at end of file
+# Labels whose id property is backed by a uniqueness constraint (and its index)
+ID_CONSTRAINT_LABELS = ("Project", "Experiment", "Document", "User", "Sample", "Protocol")
+
+# Idempotent schema setup. Lookups by id use the index backing each unique
+# constraint; a separate range index on the same property would conflict, so
+# the <label>_id range indexes older releases created are dropped first.
+SCHEMA_STATEMENTS = tuple(
+    f"DROP INDEX {label.lower()}_id IF EXISTS" for label in ID_CONSTRAINT_LABELS
+) + (
+    # Full-text search indexes
+    "CREATE FULLTEXT INDEX document_search IF NOT EXISTS FOR (d:Document) ON EACH [d.title, d.description]",
+    "CREATE FULLTEXT INDEX project_search IF NOT EXISTS FOR (p:Project) ON EACH [p.name, p.description]",
+) + tuple(
+    f"CREATE CONSTRAINT {label.lower()}_id_unique IF NOT EXISTS FOR (n:{label}) REQUIRE n.id IS UNIQUE"
+    for label in ID_CONSTRAINT_LABELS
+)
+
+
+async def init_neo4j_indexes():
+    """Initialize Neo4j indexes and constraints, one statement at a time.
+    
+    Each statement commits on its own so a failing one doesn't roll back the
+    rest; failures are logged and raised together at the end.
+    """
+    failed = []
+    async with neo4j_db.get_write_session() as session:
+        for statement in SCHEMA_STATEMENTS:
+            try:
+                result = await session.run(statement)
+                await result.consume()
+            except Neo4jError as e:
+                logger.error(f"Error running Neo4j schema statement {statement!r}: {e}")
+                failed.append(statement)
+    
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(SCHEMA_STATEMENTS)} Neo4j schema statements failed")
+    logger.info(f"Ensured {len(SCHEMA_STATEMENTS)} Neo4j indexes and constraints")
@@ -1,15 +1,52 @@
 """Database session configuration."""
-from sqlalchemy import create_engine
+import logging
+import time
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from src.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Pool sizing only applies to server databases; SQLite uses its own pools
+if settings.DATABASE_URL.startswith("sqlite"):
+    engine_options = {"connect_args": {"check_same_thread": False}}
+else:
+    engine_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "connect_args": {"application_name": "labweave", "options": "-c jit=off"},
+    }
+
 # Create database engine
+# SQL echo stays off even in DEBUG; slow statements are logged below instead.
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    echo=settings.DEBUG,
+    echo=False,
+    **engine_options,
 )
 
+
+@event.listens_for(engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    """Record when a statement starts executing."""
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    """Log statements that take longer than DB_SLOW_QUERY_MS."""
+    elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+    if elapsed_ms >= settings.DB_SLOW_QUERY_MS:
+        logger.warning(f"Slow query ({elapsed_ms:.1f} ms): {statement}")
+
+
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+# Objects stay loaded after commit so handlers can return them without a refresh
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
@@ -3,7 +3,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NodeType(str, Enum):
@@ -51,8 +51,7 @@ class GraphNode(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: Optional[datetime] = None
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 
 class GraphRelationship(BaseModel):
@@ -64,27 +63,27 @@ class GraphRelationship(BaseModel):
     properties: Dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 
 class ProjectNode(GraphNode):
     """Project node in the knowledge graph."""
-    type: NodeType = NodeType.PROJECT
+    # Defaults are not validated, so store the plain value like use_enum_values
+    type: NodeType = NodeType.PROJECT.value
     
     def __init__(self, project_id: int, name: str, description: Optional[str] = None, **kwargs):
         properties = {
             "project_id": project_id,
             "name": name,
             "description": description,
-            **kwargs
         }
+        properties.update(kwargs)
         super().__init__(id=f"project_{project_id}", properties=properties)
 
 
 class DocumentNode(GraphNode):
     """Document node in the knowledge graph."""
-    type: NodeType = NodeType.DOCUMENT
+    type: NodeType = NodeType.DOCUMENT.value
     
     def __init__(self, document_id: int, title: str, file_type: str, 
                  document_type: Optional[str] = None, **kwargs):
@@ -93,14 +92,14 @@ class DocumentNode(GraphNode):
             "title": title,
             "file_type": file_type,
             "document_type": document_type,
-            **kwargs
         }
+        properties.update(kwargs)
         super().__init__(id=f"document_{document_id}", properties=properties)
 
 
 class ExperimentNode(GraphNode):
     """Experiment node in the knowledge graph."""
-    type: NodeType = NodeType.EXPERIMENT
+    type: NodeType = NodeType.EXPERIMENT.value
     
     def __init__(self, experiment_id: int, name: str, 
                  experiment_type: Optional[str] = None, **kwargs):
@@ -108,36 +107,36 @@ class ExperimentNode(GraphNode):
             "experiment_id": experiment_id,
             "name": name,
             "experiment_type": experiment_type,
-            **kwargs
         }
+        properties.update(kwargs)
         super().__init__(id=f"experiment_{experiment_id}", properties=properties)
 
 
 class SampleNode(GraphNode):
     """Sample node in the knowledge graph."""
-    type: NodeType = NodeType.SAMPLE
+    type: NodeType = NodeType.SAMPLE.value
     
     def __init__(self, sample_id: int, name: str, sample_type: str, **kwargs):
         properties = {
             "sample_id": sample_id,
             "name": name,
             "sample_type": sample_type,
-            **kwargs
         }
+        properties.update(kwargs)
         super().__init__(id=f"sample_{sample_id}", properties=properties)
 
 
 class UserNode(GraphNode):
     """User node in the knowledge graph."""
-    type: NodeType = NodeType.USER
+    type: NodeType = NodeType.USER.value
     
     def __init__(self, user_id: int, username: str, email: str, **kwargs):
         properties = {
             "user_id": user_id,
             "username": username,
             "email": email,
-            **kwargs
         }
+        properties.update(kwargs)
         super().__init__(id=f"user_{user_id}", properties=properties)
 
 
@@ -150,8 +149,7 @@ class KnowledgeGraphQuery(BaseModel):
     max_depth: int = Field(default=3, ge=1, le=10)
     properties_filter: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class GraphPath(BaseModel):
@@ -160,5 +158,4 @@ class GraphPath(BaseModel):
     relationships: List[GraphRelationship]
     length: int
     
-    class Config:
-        use_enum_values = True
\ No newline at end of file
+    model_config = ConfigDict(use_enum_values=True)
\ No newline at end of file
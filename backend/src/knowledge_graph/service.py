@@ -1,11 +1,12 @@
 """Knowledge graph service for managing graph operations."""
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 
+from cachetools import TTLCache
 from neo4j.exceptions import Neo4jError
 
-from src.db.neo4j import neo4j_db
+from src.db.neo4j import ID_CONSTRAINT_LABELS, neo4j_db
 from src.knowledge_graph.models import (
     GraphNode, GraphRelationship, NodeType, RelationType,
     ProjectNode, DocumentNode, ExperimentNode, SampleNode, UserNode,
@@ -14,77 +15,396 @@ from src.knowledge_graph.models import (
 
 logger = logging.getLogger(__name__)
 
+MAX_DEPTH = 5
+RELATIONSHIP_LIMIT = 100
+
+# Full-text results are cached briefly for repeated queries (autocomplete etc.)
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 30  # seconds
+
+# Bulk writes at or above this many rows are committed in server-side batches
+BULK_THRESHOLD = 500
+BULK_BATCH_SIZE = 1000
+
+# Batched upserts; APOC lets the label and relationship type come from parameters
+# Existing nodes are only written, and updated_at bumped, when a property changed
+UPSERT_NODE = """
+CALL apoc.merge.node(
+    [row.type],
+    {id: row.id},
+    apoc.map.merge(row.properties, {created_at: datetime(row.created_at), updated_at: datetime()})
+) YIELD node
+WITH node, row, [key IN keys(row.properties) WHERE NOT coalesce(
+    node[key] = row.properties[key], node[key] IS NULL AND row.properties[key] IS NULL
+)] AS changed
+FOREACH (_ IN CASE WHEN size(changed) > 0 THEN [1] ELSE [] END |
+    SET node += row.properties, node.updated_at = datetime()
+)
+"""
+
+MERGE_NODES = "UNWIND $rows AS row" + UPSERT_NODE
+
+# Runs $statement once per row of $rows, committing every $batch_size rows
+PERIODIC_ITERATE = """
+CALL apoc.periodic.iterate(
+    'UNWIND $rows AS row RETURN row',
+    $statement,
+    {batchSize: $batch_size, parallel: false, params: {rows: $rows}}
+)
+YIELD failedOperations, errorMessages
+RETURN failedOperations, errorMessages
+"""
+
+# Node IDs are built as "<type>_<key>", e.g. "document_5"
+_LABELS_BY_PREFIX = {node_type.value.lower(): node_type.value for node_type in NodeType}
+
+
+def _label_for(node_id: str) -> Optional[str]:
+    """Infer a node's label from its ID so lookups can use the id constraint."""
+    prefix, _, key = node_id.partition("_")
+    return _LABELS_BY_PREFIX.get(prefix) if key else None
+
+
+def _node_pattern(var: str, label: Optional[str], id_expr: str) -> str:
+    """Render a node pattern anchored on its id, labelled when the label is known."""
+    label_clause = f":{label}" if label else ""
+    return f"({var}{label_clause} {{id: {id_expr}}})"
+
+
+def _index_hint(var: str, label: Optional[str]) -> str:
+    """Pin the planner to the id index for labels that have one."""
+    if label in ID_CONSTRAINT_LABELS:
+        return f"\n    USING INDEX {var}:{label}(id)"
+    return ""
+
+
+def _clamp_depth(depth: int) -> int:
+    """Keep traversal depth within 1..MAX_DEPTH so only a few plans exist."""
+    return max(1, min(depth, MAX_DEPTH))
+
+
+def _node_rows(nodes: List[GraphNode]) -> List[Dict[str, Any]]:
+    """Flatten nodes into the parameter rows used by the batched upserts."""
+    return [{
+        "type": node.type,
+        "id": node.id,
+        "properties": node.properties,
+        "created_at": node.created_at.isoformat(),
+    } for node in nodes]
+
+
+def _relationship_rows(relationships: List[GraphRelationship]) -> Dict[tuple, List[Dict[str, Any]]]:
+    """Group relationship rows by endpoint labels so each MATCH is an index seek."""
+    rows = {}
+    for rel in relationships:
+        labels = (_label_for(rel.source_id), _label_for(rel.target_id))
+        rows.setdefault(labels, []).append({
+            "type": rel.type,
+            "source_id": rel.source_id,
+            "target_id": rel.target_id,
+            "properties": rel.properties,
+            "created_at": rel.created_at.isoformat(),
+        })
+    return rows
+
+
+# Cypher cannot take labels, relationship types or path lengths as
+# parameters. Every variant is rendered once below into lookup tables keyed
+# by label, direction and depth, so the request path does no formatting and
+# the server sees the same text, and reuses the same plan, for each shape.
+def _merge_node_query(label: str) -> str:
+    """Build the MERGE query for nodes with the given label."""
+    return f"""
+    MERGE (n:{label} {{id: $id}})
+    ON CREATE SET n += $properties, n.created_at = datetime($created_at), n.updated_at = datetime()
+    WITH n, [key IN keys($properties) WHERE NOT coalesce(
+        n[key] = $properties[key], n[key] IS NULL AND $properties[key] IS NULL
+    )] AS changed
+    FOREACH (_ IN CASE WHEN size(changed) > 0 THEN [1] ELSE [] END |
+        SET n += $properties, n.updated_at = datetime()
+    )
+    """
+
+
+def _upsert_relationship_query(source_label: Optional[str], target_label: Optional[str]) -> str:
+    """Build the per-row relationship MERGE for one pair of endpoint labels."""
+    return f"""
+    MATCH {_node_pattern("source", source_label, "row.source_id")}{_index_hint("source", source_label)}
+    MATCH {_node_pattern("target", target_label, "row.target_id")}{_index_hint("target", target_label)}
+    CALL apoc.merge.relationship(source, row.type, {{}}, {{}}, target) YIELD rel
+    SET rel += row.properties
+    SET rel.created_at = datetime(row.created_at)
+    """
+
+
+def _match_node_query(label: Optional[str]) -> str:
+    """Build the lookup query for a node by id."""
+    return f"""
+    MATCH {_node_pattern("n", label, "$id")}{_index_hint("n", label)}
+    RETURN n
+    """
+
+
+_RELATIONSHIP_ARROWS = {
+    "outgoing": ("-", "->"),
+    "incoming": ("<-", "-"),
+    "both": ("-", "-"),
+}
+
+
+def _relationships_query(direction: str, rel_type: Optional[str], label: Optional[str]) -> str:
+    """Build the relationship listing query for one direction and type."""
+    left, right = _RELATIONSHIP_ARROWS[direction]
+    rel = f"[r:{rel_type}]" if rel_type else "[r]"
+    return f"""
+    MATCH {_node_pattern("n", label, "$id")}{left}{rel}{right}(other){_index_hint("n", label)}
+    RETURN r, other
+    LIMIT $limit
+    """
+
+
+def _shortest_path_query(max_depth: int, start_label: Optional[str],
+                         end_label: Optional[str]) -> str:
+    """Build the shortest path query for a clamped depth and endpoint labels."""
+    # Anchor both ends first so shortestPath runs from two index seeks
+    return f"""
+    MATCH {_node_pattern("start", start_label, "$start_id")}{_index_hint("start", start_label)}
+    MATCH {_node_pattern("end", end_label, "$end_id")}{_index_hint("end", end_label)}
+    MATCH path = shortestPath((start)-[*..{max_depth}]-(end))
+    RETURN path
+    """
+
+
+def _related_nodes_query(max_depth: int, label: Optional[str]) -> str:
+    """Build the related nodes query for a clamped depth."""
+    return f"""
+    MATCH {_node_pattern("start", label, "$node_id")}{_index_hint("start", label)}
+    MATCH (start)-[*1..{max_depth}]-(related)
+    WHERE related.id <> $node_id
+    RETURN DISTINCT related
+    LIMIT 100
+    """
+
+
+def _search_nodes_query(label: Optional[str], projected: bool) -> str:
+    """Build the property search query, optionally restricted to a label.
+    
+    The projected form returns just the values of $fields rather than whole
+    nodes; the field names stay a parameter so every projection shares a plan.
+    """
+    pattern = f"(n:{label})" if label else "(n)"
+    returned = "[key IN $fields | n[key]] AS values" if projected else "n"
+    return f"""
+    MATCH {pattern}
+    WHERE all(key IN keys($filters) WHERE n[key] = $filters[key])
+    RETURN {returned}
+    LIMIT 100
+    """
+
+
+_NODE_LABELS = tuple(node_type.value for node_type in NodeType)
+_LABELS = (None,) + _NODE_LABELS  # None when the label is unknown
+_REL_TYPES = (None,) + tuple(rel_type.value for rel_type in RelationType)
+_DEPTHS = range(1, MAX_DEPTH + 1)
+
+_MERGE_NODE_CYPHER = {label: _merge_node_query(label) for label in _NODE_LABELS}
+_MATCH_NODE_CYPHER = {label: _match_node_query(label) for label in _LABELS}
+_SEARCH_NODES_CYPHER = {
+    (label, projected): _search_nodes_query(label, projected)
+    for label in _LABELS for projected in (False, True)
+}
+_UPSERT_REL_CYPHER = {
+    (source, target): _upsert_relationship_query(source, target)
+    for source in _LABELS for target in _LABELS
+}
+_MERGE_RELS_CYPHER = {
+    labels: "UNWIND $rows AS row" + cypher for labels, cypher in _UPSERT_REL_CYPHER.items()
+}
+_CREATE_REL_CYPHER = {
+    labels: "WITH $row AS row" + cypher for labels, cypher in _UPSERT_REL_CYPHER.items()
+}
+_RELATIONSHIPS_CYPHER = {
+    (direction, rel_type, label): _relationships_query(direction, rel_type, label)
+    for direction in _RELATIONSHIP_ARROWS for rel_type in _REL_TYPES for label in _LABELS
+}
+_FIND_PATH_CYPHER = {
+    (depth, start, end): _shortest_path_query(depth, start, end)
+    for depth in _DEPTHS for start in _LABELS for end in _LABELS
+}
+_RELATED_CYPHER = {
+    (depth, label): _related_nodes_query(depth, label) for depth in _DEPTHS for label in _LABELS
+}
+
+
+FULLTEXT_INDEXES = {
+    NodeType.DOCUMENT: "document_search",
+    NodeType.PROJECT: "project_search",
+}
+
+SEARCH_INDEX = """
+CALL db.index.fulltext.queryNodes($index_name, $query_text)
+YIELD node, score
+RETURN node, score
+ORDER BY score DESC
+LIMIT 50
+"""
+
+# Every index in one round-trip, ranked together rather than index by index
+SEARCH_ALL_INDEXES = """
+CALL {
+    CALL db.index.fulltext.queryNodes('document_search', $query_text)
+    YIELD node, score
+    RETURN node, score
+    UNION ALL
+    CALL db.index.fulltext.queryNodes('project_search', $query_text)
+    YIELD node, score
+    RETURN node, score
+}
+RETURN node, score
+ORDER BY score DESC
+LIMIT 50
+"""
+
+
+async def collect(items: AsyncIterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drain one of the service's streaming queries into a list."""
+    return [item async for item in items]
+
 
 class KnowledgeGraphService:
-    """Service for knowledge graph operations."""
+    """Service for knowledge graph operations.
+    
+    Methods are coroutines running on the async Neo4j driver, so routes await
+    them without blocking the event loop. Queries returning many records are
+    async generators streaming from the driver; use collect() for a list.
+    """
     
     def __init__(self):
         """Initialize the knowledge graph service."""
         self.db = neo4j_db
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        # Part of every search cache key; bumped on each write so cached
+        # results, including ones still being fetched, are never served stale
+        self._write_generation = 0
+    
+    def _invalidate_search_cache(self):
+        """Make cached full-text results unreachable after the graph changes."""
+        self._write_generation += 1
     
-    def create_node(self, node: GraphNode) -> bool:
-        """Create a node in the knowledge graph."""
-        with self.db.get_session() as session:
+    async def _write_many(self, ops: List[Tuple[str, Dict[str, Any]]]):
+        """Run several write statements in a single explicit transaction."""
+        async with self.db.get_write_session() as session:
+            tx = await session.begin_transaction()
             try:
-                query = """
-                MERGE (n:{type} {{id: $id}})
-                SET n += $properties
-                SET n.created_at = datetime($created_at)
-                SET n.updated_at = datetime()
-                RETURN n
-                """.format(type=node.type)
-                
-                result = session.run(
-                    query,
-                    id=node.id,
-                    properties=node.properties,
-                    created_at=node.created_at.isoformat()
-                )
+                for cypher, params in ops:
+                    result = await tx.run(cypher, params)
+                    await result.consume()
+                await tx.commit()
+            finally:
+                await tx.close()
+                self._invalidate_search_cache()
+    
+    async def _periodic_write(self, statement: str, rows: List[Dict[str, Any]]):
+        """Apply statement to each row in server-side batches via apoc.periodic.iterate."""
+        async with self.db.get_write_session() as session:
+            result = await session.run(
+                PERIODIC_ITERATE,
+                statement=statement,
+                rows=rows,
+                batch_size=BULK_BATCH_SIZE
+            )
+            record = await result.single()
+        self._invalidate_search_cache()
+        
+        if record["failedOperations"]:
+            logger.error(f"Bulk write failed for {record['failedOperations']} rows: "
+                         f"{record['errorMessages']}")
+            raise RuntimeError(f"Bulk write failed: {record['errorMessages']}")
+    
+    async def bulk_create_nodes(self, nodes: List[GraphNode]):
+        """Create or update many nodes, batching large payloads server-side."""
+        rows = _node_rows(nodes)
+        try:
+            if len(rows) < BULK_THRESHOLD:
+                await self._write_many([(MERGE_NODES, {"rows": rows})])
+            else:
+                await self._periodic_write(UPSERT_NODE, rows)
+        except Neo4jError as e:
+            logger.error(f"Error bulk creating nodes: {e}")
+            raise
+    
+    async def bulk_create_relationships(self, relationships: List[GraphRelationship]):
+        """Create or update many relationships, batching large payloads server-side."""
+        try:
+            small_ops = []
+            for labels, rows in _relationship_rows(relationships).items():
+                if len(rows) < BULK_THRESHOLD:
+                    small_ops.append((_MERGE_RELS_CYPHER[labels], {"rows": rows}))
+                else:
+                    await self._periodic_write(_UPSERT_REL_CYPHER[labels], rows)
+            
+            if small_ops:
+                await self._write_many(small_ops)
+        except Neo4jError as e:
+            logger.error(f"Error bulk creating relationships: {e}")
+            raise
+    
+    async def create_node(self, node: GraphNode) -> bool:
+        """Create or update a node; returns False if it already matched exactly."""
+        # Serialize up front so the session is only held for the round-trip
+        query = _MERGE_NODE_CYPHER[node.type]
+        payload = {
+            "id": node.id,
+            "properties": dict(node.properties),
+            "created_at": node.created_at.isoformat(),
+        }
+        async with self.db.get_write_session() as session:
+            try:
+                result = await session.run(query, payload)
+                summary = await result.consume()
                 
-                return result.single() is not None
+                return summary.counters.nodes_created + summary.counters.properties_set > 0
                 
             except Neo4jError as e:
                 logger.error(f"Error creating node: {e}")
                 raise
+            finally:
+                self._invalidate_search_cache()
     
-    def create_relationship(self, relationship: GraphRelationship) -> bool:
-        """Create a relationship between nodes."""
-        with self.db.get_session() as session:
+    async def create_relationship(self, relationship: GraphRelationship) -> bool:
+        """Create a relationship; returns False if either endpoint is missing."""
+        query = _CREATE_REL_CYPHER[
+            _label_for(relationship.source_id), _label_for(relationship.target_id)
+        ]
+        row = {
+            "type": relationship.type,
+            "source_id": relationship.source_id,
+            "target_id": relationship.target_id,
+            "properties": dict(relationship.properties),
+            "created_at": relationship.created_at.isoformat(),
+        }
+        async with self.db.get_write_session() as session:
             try:
-                query = """
-                MATCH (source {{id: $source_id}})
-                MATCH (target {{id: $target_id}})
-                MERGE (source)-[r:{type}]->(target)
-                SET r += $properties
-                SET r.created_at = datetime($created_at)
-                RETURN r
-                """.format(type=relationship.type)
-                
-                result = session.run(
-                    query,
-                    source_id=relationship.source_id,
-                    target_id=relationship.target_id,
-                    properties=relationship.properties,
-                    created_at=relationship.created_at.isoformat()
-                )
+                result = await session.run(query, row=row)
+                summary = await result.consume()
                 
-                return result.single() is not None
+                # created_at is always set, so an existing relationship still counts
+                return summary.counters.relationships_created + summary.counters.properties_set > 0
                 
             except Neo4jError as e:
                 logger.error(f"Error creating relationship: {e}")
                 raise
+            finally:
+                self._invalidate_search_cache()
     
-    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
-        """Get a node by ID."""
-        with self.db.get_session() as session:
+    async def get_node(self, node_id: str,
+                       node_type: Optional[NodeType] = None) -> Optional[Dict[str, Any]]:
+        """Get a node by ID, using node_type (or the ID prefix) as a label hint."""
+        label = NodeType(node_type).value if node_type else _label_for(node_id)
+        async with self.db.get_read_session() as session:
             try:
-                query = """
-                MATCH (n {{id: $id}})
-                RETURN n
-                """
-                
-                result = session.run(query, id=node_id)
-                record = result.single()
+                result = await session.run(_MATCH_NODE_CYPHER[label], id=node_id)
+                record = await result.single()
                 
                 if record:
                     return dict(record["n"])
@@ -94,59 +414,40 @@ class KnowledgeGraphService:
                 logger.error(f"Error getting node: {e}")
                 raise
     
-    def get_node_relationships(self, node_id: str, 
+    async def get_node_relationships(self, node_id: str, 
                              relationship_type: Optional[str] = None,
-                             direction: str = "both") -> List[Dict[str, Any]]:
-        """Get relationships for a node."""
-        with self.db.get_session() as session:
+                             direction: str = "both",
+                             node_type: Optional[NodeType] = None,
+                             limit: int = RELATIONSHIP_LIMIT) -> AsyncIterator[Dict[str, Any]]:
+        """Yield relationships for a node as records arrive."""
+        label = NodeType(node_type).value if node_type else _label_for(node_id)
+        rel_type = RelationType(relationship_type).value if relationship_type else None
+        query = _RELATIONSHIPS_CYPHER[direction, rel_type, label]
+        async with self.db.get_read_session() as session:
             try:
-                if direction == "outgoing":
-                    pattern = "(n)-[r]->(target)"
-                elif direction == "incoming":
-                    pattern = "(source)-[r]->(n)"
-                else:
-                    pattern = "(n)-[r]-(connected)"
+                result = await session.run(query, id=node_id, limit=limit)
                 
-                if relationship_type:
-                    pattern = pattern.replace("[r]", f"[r:{relationship_type}]")
-                
-                query = f"""
-                MATCH {{n {{id: $id}}}}
-                MATCH {pattern}
-                RETURN r, 
-                       CASE 
-                           WHEN exists(target) THEN target
-                           WHEN exists(source) THEN source
-                           ELSE connected
-                       END as other_node
-                """
-                
-                result = session.run(query, id=node_id)
-                
-                relationships = []
-                for record in result:
+                async for record in result:
                     rel = dict(record["r"])
-                    rel["other_node"] = dict(record["other_node"])
-                    relationships.append(rel)
-                
-                return relationships
+                    rel["other_node"] = dict(record["other"])
+                    yield rel
                 
             except Neo4jError as e:
                 logger.error(f"Error getting relationships: {e}")
                 raise
     
-    def find_path(self, start_id: str, end_id: str, 
-                  max_depth: int = 5) -> Optional[GraphPath]:
-        """Find shortest path between two nodes."""
-        with self.db.get_session() as session:
+    async def find_path(self, start_id: str, end_id: str, 
+                  max_depth: int = 5,
+                  start_type: Optional[NodeType] = None,
+                  end_type: Optional[NodeType] = None) -> Optional[GraphPath]:
+        """Find shortest path between two nodes, using label hints when known."""
+        start_label = NodeType(start_type).value if start_type else _label_for(start_id)
+        end_label = NodeType(end_type).value if end_type else _label_for(end_id)
+        query = _FIND_PATH_CYPHER[_clamp_depth(max_depth), start_label, end_label]
+        async with self.db.get_read_session() as session:
             try:
-                query = """
-                MATCH path = shortestPath((start {{id: $start_id}})-[*..{max_depth}]-(end {{id: $end_id}}))
-                RETURN path
-                """.format(max_depth=max_depth)
-                
-                result = session.run(query, start_id=start_id, end_id=end_id)
-                record = result.single()
+                result = await session.run(query, start_id=start_id, end_id=end_id)
+                record = await result.single()
                 
                 if record:
                     path = record["path"]
@@ -175,154 +476,109 @@ class KnowledgeGraphService:
                 logger.error(f"Error finding path: {e}")
                 raise
     
-    def search_nodes(self, query: KnowledgeGraphQuery) -> List[Dict[str, Any]]:
-        """Search for nodes based on criteria."""
-        with self.db.get_session() as session:
+    async def search_nodes(self, query: KnowledgeGraphQuery,
+                           fields: Optional[List[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield nodes matching the search criteria, limited to fields if given."""
+        async with self.db.get_read_session() as session:
             try:
-                cypher_query = "MATCH (n"
-                params = {}
-                
-                if query.node_type:
-                    cypher_query += f":{query.node_type}"
-                
-                cypher_query += ")"
-                
-                # Add property filters
-                where_clauses = []
-                for key, value in query.properties_filter.items():
-                    param_key = f"prop_{key}"
-                    where_clauses.append(f"n.{key} = ${param_key}")
-                    params[param_key] = value
-                
-                if where_clauses:
-                    cypher_query += " WHERE " + " AND ".join(where_clauses)
-                
-                cypher_query += " RETURN n LIMIT 100"
-                
-                result = session.run(cypher_query, **params)
-                
-                nodes = []
-                for record in result:
-                    nodes.append(dict(record["n"]))
-                
-                return nodes
+                result = await session.run(
+                    _SEARCH_NODES_CYPHER[query.node_type, fields is not None],
+                    filters=query.properties_filter,
+                    fields=fields
+                )
                 
-            except Neo4jError as e:
-                logger.error(f"Error searching nodes: {e}")
-                raise
-    
-    def full_text_search(self, query_text: str, 
-                        node_type: Optional[NodeType] = None) -> List[Dict[str, Any]]:
-        """Perform full-text search on indexed properties."""
-        with self.db.get_session() as session:
-            try:
-                if node_type == NodeType.DOCUMENT:
-                    index_name = "document_search"
-                elif node_type == NodeType.PROJECT:
-                    index_name = "project_search"
+                if fields is None:
+                    async for record in result:
+                        yield dict(record["n"])
                 else:
-                    # Search all text indexes
-                    results = []
-                    for idx in ["document_search", "project_search"]:
-                        results.extend(self._search_index(session, idx, query_text))
-                    return results
-                
-                return self._search_index(session, index_name, query_text)
+                    async for record in result:
+                        yield dict(zip(fields, record["values"]))
                 
             except Neo4jError as e:
-                logger.error(f"Error in full-text search: {e}")
+                logger.error(f"Error searching nodes: {e}")
                 raise
     
-    def _search_index(self, session, index_name: str, query_text: str) -> List[Dict[str, Any]]:
-        """Search a specific full-text index."""
-        query = f"""
-        CALL db.index.fulltext.queryNodes('{index_name}', $query_text)
-        YIELD node, score
-        RETURN node, score
-        ORDER BY score DESC
-        LIMIT 50
-        """
+    async def full_text_search(self, query_text: str, 
+                        node_type: Optional[NodeType] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield full-text search hits on indexed properties, best first."""
+        index_name = FULLTEXT_INDEXES.get(node_type)
+        cache_key = (self._write_generation, index_name, query_text)
+        hits = self._search_cache.get(cache_key)
         
-        result = session.run(query, query_text=query_text)
+        if hits is None:
+            async with self.db.get_read_session() as session:
+                try:
+                    if index_name:
+                        result = await session.run(
+                            SEARCH_INDEX, index_name=index_name, query_text=query_text
+                        )
+                    else:
+                        result = await session.run(SEARCH_ALL_INDEXES, query_text=query_text)
+                    
+                    hits = [node_data async for node_data in self._scored_nodes(result)]
+                    
+                except Neo4jError as e:
+                    logger.error(f"Error in full-text search: {e}")
+                    raise
+            # Checking and filling the cache never spans an await, so the
+            # event loop needs no lock around it
+            self._search_cache[cache_key] = hits
         
-        results = []
-        for record in result:
+        for node_data in hits:
+            yield dict(node_data)
+    
+    async def _scored_nodes(self, result) -> AsyncIterator[Dict[str, Any]]:
+        """Convert full-text search records to node dicts carrying their score."""
+        async for record in result:
             node_data = dict(record["node"])
             node_data["_score"] = record["score"]
-            results.append(node_data)
-        
-        return results
+            yield node_data
     
-    def get_related_nodes(self, node_id: str, max_depth: int = 2) -> List[Dict[str, Any]]:
-        """Get all nodes related to a given node up to max_depth."""
-        with self.db.get_session() as session:
+    async def get_related_nodes(self, node_id: str, max_depth: int = 2) -> AsyncIterator[Dict[str, Any]]:
+        """Yield nodes related to a given node up to max_depth."""
+        async with self.db.get_read_session() as session:
             try:
-                query = """
-                MATCH (start {{id: $node_id}})
-                MATCH (start)-[*1..{max_depth}]-(related)
-                WHERE related.id <> $node_id
-                RETURN DISTINCT related
-                LIMIT 100
-                """.format(max_depth=max_depth)
-                
-                result = session.run(query, node_id=node_id)
-                
-                nodes = []
-                for record in result:
-                    nodes.append(dict(record["related"]))
+                query = _RELATED_CYPHER[_clamp_depth(max_depth), _label_for(node_id)]
+                result = await session.run(query, node_id=node_id)
                 
-                return nodes
+                async for record in result:
+                    yield dict(record["related"])
                 
             except Neo4jError as e:
                 logger.error(f"Error getting related nodes: {e}")
                 raise
     
-    def create_document_uploaded_event(self, document_id: int, user_id: int, 
-                                     project_id: int, experiment_id: Optional[int] = None):
+    async def create_document_uploaded_event(self, doc_node: DocumentNode, user_node: UserNode,
+                                     project_node: Optional[ProjectNode] = None,
+                                     experiment_node: Optional[ExperimentNode] = None):
         """Create graph nodes and relationships when a document is uploaded."""
         try:
-            # Create or update user node
-            user_node = UserNode(user_id=user_id, username=f"user_{user_id}", 
-                               email=f"user_{user_id}@example.com")
-            self.create_node(user_node)
+            nodes = [user_node, doc_node]
             
-            # Create document node
-            doc_node = DocumentNode(document_id=document_id, 
-                                  title=f"Document {document_id}",
-                                  file_type="unknown")
-            self.create_node(doc_node)
-            
-            # Create relationships
             # User uploaded document
-            self.create_relationship(GraphRelationship(
+            relationships = [GraphRelationship(
                 type=RelationType.CREATED_BY,
                 source_id=doc_node.id,
                 target_id=user_node.id
-            ))
+            )]
             
-            # Document belongs to project
-            if project_id:
-                project_node = ProjectNode(project_id=project_id, 
-                                         name=f"Project {project_id}")
-                self.create_node(project_node)
-                
-                self.create_relationship(GraphRelationship(
-                    type=RelationType.BELONGS_TO,
-                    source_id=doc_node.id,
-                    target_id=project_node.id
-                ))
+            # Document belongs to project and, optionally, an experiment
+            for parent in (project_node, experiment_node):
+                if parent is not None:
+                    nodes.append(parent)
+                    relationships.append(GraphRelationship(
+                        type=RelationType.BELONGS_TO,
+                        source_id=doc_node.id,
+                        target_id=parent.id
+                    ))
             
-            # Document belongs to experiment
-            if experiment_id:
-                exp_node = ExperimentNode(experiment_id=experiment_id,
-                                        name=f"Experiment {experiment_id}")
-                self.create_node(exp_node)
-                
-                self.create_relationship(GraphRelationship(
-                    type=RelationType.BELONGS_TO,
-                    source_id=doc_node.id,
-                    target_id=exp_node.id
-                ))
+            # A handful of rows, so nodes and relationships share one transaction
+            ops = [(MERGE_NODES, {"rows": _node_rows(nodes)})]
+            ops.extend(
+                (_MERGE_RELS_CYPHER[labels], {"rows": rows})
+                for labels, rows in _relationship_rows(relationships).items()
+            )
+            await self._write_many(ops)
                 
         except Exception as e:
             logger.error(f"Error creating document upload event: {e}")
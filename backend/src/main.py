@@ -1,6 +1,9 @@
 """Main FastAPI application entry point."""
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 
 from src.config import settings
@@ -11,6 +14,31 @@ from src.db.neo4j import neo4j_db, init_neo4j_indexes
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect services on startup and release them on shutdown."""
+    try:
+        # Connect the shared Neo4j driver and initialize indexes
+        logger.info("Connecting to Neo4j...")
+        await neo4j_db.connect()
+        logger.info("Initializing Neo4j indexes...")
+        await init_neo4j_indexes()
+        logger.info("Neo4j initialization complete")
+    except Exception as e:
+        logger.error(f"Error during startup: {e}")
+        # Don't fail startup if Neo4j is not available
+        logger.warning("Continuing without Neo4j connection")
+    
+    yield
+    
+    try:
+        # Close Neo4j connection
+        await neo4j_db.close()
+    except Exception as e:
+        logger.error(f"Error during shutdown: {e}")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="LabWeave API",
@@ -19,6 +47,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     debug=True,  # Enable debug mode to see more info
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -44,27 +74,16 @@ def root():
     }
 
 
-# Application lifecycle events
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup."""
-    try:
-        # Initialize Neo4j indexes
-        logger.info("Initializing Neo4j indexes...")
-        init_neo4j_indexes()
-        logger.info("Neo4j initialization complete")
-    except Exception as e:
-        logger.error(f"Error during startup: {e}")
-        # Don't fail startup if Neo4j is not available
-        logger.warning("Continuing without Neo4j connection")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up on shutdown."""
+@app.get("/healthz")
+async def healthz():
+    """Liveness check that verifies the Neo4j driver can reach the server."""
     try:
-        # Close Neo4j connection
-        neo4j_db.close()
-        logger.info("Neo4j connection closed")
+        await neo4j_db.verify_connectivity()
     except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
\ No newline at end of file
+        logger.warning(f"Health check failed: {e}")
+        return ORJSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "neo4j_connected": False},
+        )
+    
+    return {"status": "ok", "neo4j_connected": True}
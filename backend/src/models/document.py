@@ -1,7 +1,8 @@
 """Document model for knowledge management."""
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Index, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from src.models.base import Base
 
@@ -21,8 +22,9 @@ class Document(Base):
     
     # Document metadata
     document_type = Column(String(50))  # research_paper, protocol, dataset, analysis, etc.
-    tags = Column(JSON)  # List of tags for categorization
-    extra_metadata = Column(JSON)  # Flexible metadata storage
+    # JSONB on PostgreSQL so tag and metadata filters can use GIN indexes
+    tags = Column(JSON().with_variant(JSONB(), "postgresql"))  # List of tags for categorization
+    extra_metadata = Column(JSON().with_variant(JSONB(), "postgresql"))  # Flexible metadata storage
     
     # Version control fields
     version_number = Column(Integer, default=1, nullable=False)
@@ -40,13 +42,15 @@ class Document(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
-    # Relationships
-    project = relationship("Project", back_populates="documents")
-    experiment = relationship("Experiment", back_populates="documents")
-    uploader = relationship("User", back_populates="uploaded_documents")
+    # Relationships (lazy="raise" so an accidental per-row load fails loudly;
+    # use selectinload() in queries that need them)
+    project = relationship("Project", back_populates="documents", lazy="raise")
+    experiment = relationship("Experiment", back_populates="documents", lazy="raise")
+    uploader = relationship("User", back_populates="uploaded_documents", lazy="raise")
     
-    # Self-referential relationships for versioning
-    parent_document = relationship("Document", remote_side=[id], backref="versions")
+    # Self-referential relationships for versioning. The versions collection stays
+    # lazy so deleting a root document can null out its children's parent id.
+    parent_document = relationship("Document", remote_side=[id], backref="versions", lazy="raise")
     
     # Table constraints
     __table_args__ = (
@@ -56,7 +60,16 @@ class Document(Base):
             "(project_id IS NULL AND experiment_id IS NOT NULL)",
             name="check_document_parent"
         ),
+        # Latest-version lookups only ever touch is_latest rows, so index just those
+        Index('idx_latest_document_true', 'document_type', 'project_id', 'experiment_id',
+              postgresql_where=text('is_latest')),
+        Index('idx_latest_experiment_true', 'document_type', 'experiment_id',
+              postgresql_where=text('is_latest AND experiment_id IS NOT NULL')),
         # Ensure version consistency
-        Index('idx_latest_document', 'document_type', 'project_id', 'experiment_id', 'is_latest'),
         Index('idx_document_versions', 'parent_document_id', 'version_number'),
+        # Duplicate detection by SHA256
+        Index('idx_document_file_hash', 'file_hash'),
+        # Containment queries on tags and metadata
+        Index('idx_documents_tags_gin', 'tags', postgresql_using='gin'),
+        Index('idx_documents_meta_gin', 'extra_metadata', postgresql_using='gin'),
     )
\ No newline at end of file
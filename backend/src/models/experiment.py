@@ -10,7 +10,7 @@ class Experiment(BaseModel):
     
     name = Column(String, nullable=False)
     description = Column(Text)
-    status = Column(String, default="planned")  # planned, in_progress, completed, failed
+    status = Column(String, default="planned")  # planned, active, in_progress, completed, failed
     experiment_type = Column(String)  # metagenomics, transcriptomics, etc.
     
     # Foreign keys
@@ -10,7 +10,7 @@ class Project(BaseModel):
     
     name = Column(String, nullable=False)
     description = Column(Text)
-    status = Column(String, default="active")  # active, archived, completed
+    status = Column(String, default="active")  # planning, active, on_hold, completed, archived
     
     # Foreign keys
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -0,0 +1,34 @@
+"""API schemas.
+
+Schemas are re-exported lazily (PEP 562): ``from src.schemas import Document``
+imports only the module that defines it, so loading the package does not build
+every model's core schema up front.
+"""
+import importlib
+
+_MODULES = {
+    "document": ("Document", "DocumentCreate", "DocumentListItem", "DocumentUpdate", "DocumentVersion"),
+    "experiment": ("Experiment", "ExperimentCreate", "ExperimentUpdate"),
+    "project": ("Project", "ProjectCreate", "ProjectUpdate"),
+    "protocol": ("Protocol", "ProtocolCreate", "ProtocolUpdate"),
+    "sample": ("Sample", "SampleCreate", "SampleUpdate"),
+    "user": ("User", "UserCreate", "UserRead", "UserUpdate"),
+}
+_EXPORTS = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the schema's module on first access and cache the attribute."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
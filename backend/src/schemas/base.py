@@ -0,0 +1,71 @@
+"""Shared schema helpers."""
+import operator
+import sys
+from typing import Dict, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+# Config for schemas read back from the database: built from ORM attributes,
+# unknown attributes ignored, and instances immutable once constructed.
+ORM_RESPONSE_CONFIG = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
+
+
+class ORMFastMixin:
+    """Mixin for response schemas built from rows in our own database."""
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        """Record each schema's field names and their getter once, when the class is built."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__orm_field_names__ = tuple(sys.intern(name) for name in cls.model_fields)
+        getter = operator.attrgetter(*cls.__orm_field_names__)
+        if len(cls.__orm_field_names__) == 1:
+            # attrgetter with one name returns the bare value, not a tuple
+            cls.__orm_getter__ = lambda obj: (getter(obj),)
+        else:
+            cls.__orm_getter__ = getter
+    
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """Build the schema from a trusted ORM row without running validation.
+        
+        Only for rows read back from the database; anything that came from a
+        client must still go through model_validate. Rows lacking one of the
+        schema's attributes fall back to model_validate, which fills in the
+        field defaults.
+        """
+        try:
+            values = cls.__orm_getter__(obj)
+        except AttributeError:
+            return cls.model_validate(obj)
+        return cls.model_construct(**dict(zip(cls.__orm_field_names__, values)))
+
+
+_PARTIALS: Dict[Tuple[type, str, Tuple[str, ...]], Type[BaseModel]] = {}
+
+
+def make_partial(
+    model: Type[BaseModel],
+    *,
+    name: str,
+    exclude: Sequence[str] = (),
+) -> Type[BaseModel]:
+    """Build (once) a copy of model with every field optional and defaulting to None.
+    
+    Used for PATCH schemas, which are dumped with exclude_unset so only the
+    fields a client actually sent are applied.
+    """
+    key = (model, name, tuple(exclude))
+    if key not in _PARTIALS:
+        fields = {
+            field_name: (Optional[field.annotation], None)
+            for field_name, field in model.model_fields.items()
+            if field_name not in exclude
+        }
+        _PARTIALS[key] = create_model(
+            name,
+            __doc__=f"Schema for updating {model.__name__} fields; all optional.",
+            __module__=model.__module__,
+            **fields,
+        )
+    return _PARTIALS[key]
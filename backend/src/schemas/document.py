@@ -1,7 +1,9 @@
 """Document schemas."""
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, TypeAdapter, validator
+
+from src.schemas.base import ORM_RESPONSE_CONFIG, ORMFastMixin, make_partial
 
 
 class DocumentBase(BaseModel):
@@ -10,8 +12,8 @@ class DocumentBase(BaseModel):
     description: Optional[str] = None
     file_type: Optional[str] = None
     document_type: Optional[str] = None
-    tags: Optional[List[str]] = []
-    extra_metadata: Optional[Dict[str, Any]] = {}
+    tags: Optional[List[str]] = Field(default_factory=list)
+    extra_metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
 
 class DocumentCreate(DocumentBase):
@@ -20,13 +22,8 @@ class DocumentCreate(DocumentBase):
     experiment_id: Optional[int] = None
 
 
-class DocumentUpdate(BaseModel):
-    """Schema for updating a document."""
-    title: Optional[str] = None
-    description: Optional[str] = None
-    document_type: Optional[str] = None
-    tags: Optional[List[str]] = None
-    extra_metadata: Optional[Dict[str, Any]] = None
+# file_type is derived from the uploaded file, so it cannot be patched
+DocumentUpdate = make_partial(DocumentBase, name="DocumentUpdate", exclude=("file_type",))
 
 
 class DocumentUploadResponse(BaseModel):
@@ -37,7 +34,7 @@ class DocumentUploadResponse(BaseModel):
     mime_type: str
 
 
-class DocumentInDBBase(DocumentBase):
+class DocumentInDBBase(ORMFastMixin, DocumentBase):
     """Base schema for document in database."""
     id: int
     file_path: Optional[str]
@@ -56,8 +53,7 @@ class DocumentInDBBase(DocumentBase):
     version_comment: Optional[str] = None
     file_hash: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class Document(DocumentInDBBase):
@@ -65,7 +61,20 @@ class Document(DocumentInDBBase):
     pass
 
 
-class DocumentVersion(BaseModel):
+class DocumentListItem(ORMFastMixin, BaseModel):
+    """Schema for a row in the document list; the detail route has the rest."""
+    id: int
+    title: str
+    file_type: Optional[str] = None
+    document_type: Optional[str] = None
+    version_number: int = 1
+    is_latest: bool = True
+    updated_at: datetime
+    
+    model_config = ORM_RESPONSE_CONFIG
+
+
+class DocumentVersion(ORMFastMixin, BaseModel):
     """Schema for document version response."""
     id: int
     version_number: int
@@ -77,4 +86,9 @@ class DocumentVersion(BaseModel):
     file_hash: Optional[str]
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# List adapters built once at import and shared by the list endpoints
+document_list_adapter = TypeAdapter(List[DocumentListItem])
+document_version_list_adapter = TypeAdapter(List[DocumentVersion])
@@ -1,8 +1,14 @@
 """Experiment schemas."""
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
+from src.schemas.base import ORM_RESPONSE_CONFIG, ORMFastMixin
+
+# Statuses accepted on input; the dashboard counts "active" experiments.
+# Responses keep plain str so rows with older values still serialize.
+ExperimentStatus = Literal["planned", "active", "in_progress", "completed", "failed"]
+
 
 class ExperimentBase(BaseModel):
     """Base experiment schema."""
@@ -16,6 +22,7 @@ class ExperimentBase(BaseModel):
 
 class ExperimentCreate(ExperimentBase):
     """Schema for creating an experiment."""
+    status: ExperimentStatus = "planned"
     project_id: int
     creator_id: int
     protocol_id: Optional[int] = None
@@ -24,10 +31,10 @@ class ExperimentCreate(ExperimentBase):
 class ExperimentUpdate(ExperimentBase):
     """Schema for updating an experiment."""
     name: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[ExperimentStatus] = None
 
 
-class ExperimentInDBBase(ExperimentBase):
+class ExperimentInDBBase(ORMFastMixin, ExperimentBase):
     """Base schema for experiment in database."""
     id: int
     project_id: int
@@ -36,8 +43,7 @@ class ExperimentInDBBase(ExperimentBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class Experiment(ExperimentInDBBase):
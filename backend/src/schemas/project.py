@@ -1,8 +1,14 @@
 """Project schemas."""
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
+from src.schemas.base import ORM_RESPONSE_CONFIG, ORMFastMixin
+
+# Statuses accepted on input; the frontend offers planning/active/on_hold/completed.
+# Responses keep plain str so rows with older values still serialize.
+ProjectStatus = Literal["planning", "active", "on_hold", "completed", "archived"]
+
 
 class ProjectBase(BaseModel):
     """Base project schema."""
@@ -14,24 +20,24 @@ class ProjectBase(BaseModel):
 
 class ProjectCreate(ProjectBase):
     """Schema for creating a project."""
+    status: ProjectStatus = "active"
     owner_id: int
 
 
 class ProjectUpdate(ProjectBase):
     """Schema for updating a project."""
     name: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[ProjectStatus] = None
 
 
-class ProjectInDBBase(ProjectBase):
+class ProjectInDBBase(ORMFastMixin, ProjectBase):
     """Base schema for project in database."""
     id: int
     owner_id: int
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class Project(ProjectInDBBase):
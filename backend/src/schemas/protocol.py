@@ -3,6 +3,8 @@ from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel
 
+from src.schemas.base import ORM_RESPONSE_CONFIG, ORMFastMixin, make_partial
+
 
 class ProtocolBase(BaseModel):
     """Base protocol schema."""
@@ -19,25 +21,17 @@ class ProtocolCreate(ProtocolBase):
     author_id: int
 
 
-class ProtocolUpdate(BaseModel):
-    """Schema for updating a protocol."""
-    name: Optional[str] = None
-    description: Optional[str] = None
-    protocol_type: Optional[str] = None
-    version: Optional[str] = None
-    content: Optional[str] = None
-    extra_metadata: Optional[str] = None
+ProtocolUpdate = make_partial(ProtocolBase, name="ProtocolUpdate")
 
 
-class ProtocolInDBBase(ProtocolBase):
+class ProtocolInDBBase(ORMFastMixin, ProtocolBase):
     """Base schema for protocol in database."""
     id: int
     author_id: int
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class Protocol(ProtocolInDBBase):
@@ -1,8 +1,14 @@
 """Sample schemas."""
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
+from src.schemas.base import ORM_RESPONSE_CONFIG, ORMFastMixin, make_partial
+
+# Statuses accepted on input; responses keep plain str so rows with older
+# values still serialize.
+SampleStatus = Literal["collected", "received", "processing", "processed", "discarded"]
+
 
 class SampleBase(BaseModel):
     """Base sample schema."""
@@ -17,22 +23,17 @@ class SampleBase(BaseModel):
 
 class SampleCreate(SampleBase):
     """Schema for creating a sample."""
+    status: SampleStatus = "collected"
     experiment_id: int
     collected_by: int
 
 
-class SampleUpdate(BaseModel):
-    """Schema for updating a sample."""
-    name: Optional[str] = None
-    description: Optional[str] = None
-    sample_type: Optional[str] = None
-    source: Optional[str] = None
-    status: Optional[str] = None
-    storage_location: Optional[str] = None
-    extra_metadata: Optional[str] = None
+SampleUpdate = make_partial(
+    SampleCreate, name="SampleUpdate", exclude=("experiment_id", "collected_by")
+)
 
 
-class SampleInDBBase(SampleBase):
+class SampleInDBBase(ORMFastMixin, SampleBase):
     """Base schema for sample in database."""
     id: int
     experiment_id: int
@@ -42,8 +43,7 @@ class SampleInDBBase(SampleBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class Sample(SampleInDBBase):
@@ -2,6 +2,8 @@
 from typing import Optional
 from pydantic import BaseModel, EmailStr
 
+from src.schemas.base import ORM_RESPONSE_CONFIG, ORMFastMixin
+
 
 class UserBase(BaseModel):
     """Base user schema."""
@@ -27,12 +29,24 @@ class UserUpdate(BaseModel):
     password: Optional[str] = None
 
 
-class UserInDBBase(UserBase):
+class UserRead(BaseModel):
+    """User fields as read back from the database.
+    
+    Addresses were validated as EmailStr when written, so reads skip the
+    email-validator check.
+    """
+    email: str
+    username: str
+    full_name: Optional[str] = None
+    is_active: bool = True
+    is_superuser: bool = False
+
+
+class UserInDBBase(ORMFastMixin, UserRead):
     """Base schema for user in database."""
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 class User(UserInDBBase):
@@ -1,15 +1,16 @@
 """Test script for verifying all endpoints are working."""
-import requests
-import json
+import asyncio
+
+import httpx
 
 BASE_URL = "http://localhost:8002/api/v1"
 
-def test_health():
+async def test_health(client):
     """Test health endpoint."""
-    response = requests.get(f"{BASE_URL}/health/")
+    response = await client.get("/health/")
     print(f"Health Check: {response.status_code} - {response.json()}")
-    
-def test_auth():
+
+async def test_auth(client):
     """Test authentication."""
     # Create a test user first
     user_data = {
@@ -21,7 +22,7 @@ def test_auth():
         "is_superuser": False
     }
     
-    response = requests.post(f"{BASE_URL}/users/", json=user_data)
+    response = await client.post("/users/", json=user_data)
     print(f"Create User: {response.status_code}")
     
     # Login
@@ -29,7 +30,7 @@ def test_auth():
         "username": "testuser",
         "password": "testpass123"
     }
-    response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
+    response = await client.post("/auth/login", data=login_data)
     print(f"Login: {response.status_code}")
     if response.status_code == 200:
         token = response.json()["access_token"]
@@ -37,13 +38,11 @@ def test_auth():
         return token
     return None
 
-def test_endpoints(token):
-    """Test CRUD endpoints."""
-    headers = {"Authorization": f"Bearer {token}"}
-    
+async def test_project_chain(client, headers):
+    """Create a project, then an experiment in it, then a sample in that."""
     # Test Projects
     project_data = {"name": "Test Project", "description": "Test Description"}
-    response = requests.post(f"{BASE_URL}/projects/", json=project_data, headers=headers)
+    response = await client.post("/projects/", json=project_data, headers=headers)
     print(f"Create Project: {response.status_code}")
     
     # Test Experiments
@@ -53,18 +52,9 @@ def test_endpoints(token):
         "project_id": 1,
         "creator_id": 1
     }
-    response = requests.post(f"{BASE_URL}/experiments/", json=experiment_data, headers=headers)
+    response = await client.post("/experiments/", json=experiment_data, headers=headers)
     print(f"Create Experiment: {response.status_code}")
     
-    # Test Protocols
-    protocol_data = {
-        "name": "Test Protocol",
-        "description": "Test Description",
-        "author_id": 1
-    }
-    response = requests.post(f"{BASE_URL}/protocols/", json=protocol_data, headers=headers)
-    print(f"Create Protocol: {response.status_code}")
-    
     # Test Samples
     sample_data = {
         "name": "Test Sample",
@@ -72,21 +62,49 @@ def test_endpoints(token):
         "experiment_id": 1,
         "collected_by": 1
     }
-    response = requests.post(f"{BASE_URL}/samples/", json=sample_data, headers=headers)
+    response = await client.post("/samples/", json=sample_data, headers=headers)
     print(f"Create Sample: {response.status_code}")
-    
-    # Test Documents (without file upload)
-    response = requests.get(f"{BASE_URL}/documents/", headers=headers)
+
+async def test_protocol(client, headers):
+    """Create a protocol."""
+    protocol_data = {
+        "name": "Test Protocol",
+        "description": "Test Description",
+        "author_id": 1
+    }
+    response = await client.post("/protocols/", json=protocol_data, headers=headers)
+    print(f"Create Protocol: {response.status_code}")
+
+async def test_documents(client, headers):
+    """List documents (without file upload)."""
+    response = await client.get("/documents/", headers=headers)
     print(f"List Documents: {response.status_code}")
 
+async def test_endpoints(client, token):
+    """Test CRUD endpoints, running the independent probes concurrently."""
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    # Experiments and samples reference the project created before them, so
+    # only that chain stays sequential
+    await asyncio.gather(
+        test_project_chain(client, headers),
+        test_protocol(client, headers),
+        test_documents(client, headers),
+    )
+
+async def main():
+    """Run the probes over one pooled client."""
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        await test_health(client)
+        token = await test_auth(client)
+        
+        if token:
+            await test_endpoints(client, token)
+        else:
+            print("Authentication failed, skipping other tests")
+
 if __name__ == "__main__":
     print("Testing LabWeave API Endpoints...")
     print("-" * 30)
     
-    test_health()
-    token = test_auth()
-    
-    if token:
-        test_endpoints(token)
-    else:
-        print("Authentication failed, skipping other tests")
\ No newline at end of file
+    asyncio.run(main())
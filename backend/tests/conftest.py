@@ -1,48 +1,114 @@
 """Test configuration and fixtures."""
+from pathlib import Path
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
-from src.main import app
+from src.main import app as main_app
 from src.db.base import Base
 from src.api.v1.endpoints.auth import get_db
 
-# Test database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+# pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
-# Create test engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+
+# Create test session; commits inside a test only release a SAVEPOINT
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    join_transaction_mode="create_savepoint",
 )
 
-# Create test session
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _read_sources(package: str) -> dict:
+    """Read every module in a src package as bytes, keyed by module name."""
+    return {
+        path.stem: path.read_bytes()
+        for path in (SRC_DIR / package).glob("*.py")
+        if path.name != "__init__.py"
+    }
+
+
+@pytest.fixture(scope="session")
+def model_sources():
+    """Source of each src/models module, read once per run."""
+    return _read_sources("models")
+
+
+@pytest.fixture(scope="session")
+def schema_sources():
+    """Source of each src/schemas module, read once per run."""
+    return _read_sources("schemas")
+
+
+@pytest.fixture(scope="session")
+def memory_engine():
+    """In-memory SQLite engine with every model's table created once per run."""
+    import src.models  # noqa: F401 - registers all models on Base.metadata
+    
+    # StaticPool hands out one connection, so the in-memory database survives
+    memory_engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(memory_engine, "connect", _disable_pysqlite_transactions)
+    event.listen(memory_engine, "begin", _emit_begin)
+    Base.metadata.create_all(bind=memory_engine)
+    yield memory_engine
+    memory_engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def db():
-    """Create a test database session."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+def db(memory_engine):
+    """Create a test database session rolled back after each test."""
+    connection = memory_engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection)
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application, imported and built once per test run."""
+    return main_app
+
+
+@pytest.fixture(scope="session")
+def app_client(app):
+    """Share one client per run without running the app's lifespan.
+    
+    The lifespan only connects Neo4j, which the tests don't need at startup;
+    used outside a ``with`` block, TestClient skips it.
+    """
+    return TestClient(app, raise_server_exceptions=True)
 
 
 @pytest.fixture(scope="function")
-def client(db):
-    """Create a test client."""
+def client(app_client, db):
+    """Create a test client bound to this test's database session."""
     def override_get_db():
         try:
             yield db
         finally:
             pass
     
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app_client.app.dependency_overrides[get_db] = override_get_db
+    yield app_client
+    app_client.app.dependency_overrides.clear()
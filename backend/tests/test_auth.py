@@ -2,6 +2,10 @@
 from src.core.security import get_password_hash
 from src.models.user import User
 
+# bcrypt is deliberately slow, so hash the shared test password once per run
+TEST_PASSWORD = "testpassword"
+TEST_PASSWORD_HASH = get_password_hash(TEST_PASSWORD)
+
 
 def test_login(client, db):
     """Test login endpoint."""
@@ -9,7 +13,7 @@ def test_login(client, db):
     test_user = User(
         email="test@example.com",
         username="testuser",
-        hashed_password=get_password_hash("testpassword")
+        hashed_password=TEST_PASSWORD_HASH
     )
     db.add(test_user)
     db.commit()
@@ -17,7 +21,7 @@ def test_login(client, db):
     # Test login
     response = client.post(
         "/api/v1/auth/login",
-        data={"username": "testuser", "password": "testpassword"}
+        data={"username": "testuser", "password": TEST_PASSWORD}
     )
     
     assert response.status_code == 200
@@ -10,6 +10,11 @@ from src.models.user import User
 from src.models.project import Project
 from src.models.document import Document
 
+# Upload payloads, encoded once at import and shared by the tests below
+ORIGINAL_CONTENT = b"Original content"
+VERSION_CONTENT = {i: f"Version {i}".encode() for i in range(1, 4)}
+DOC_CONTENT = [(f"Doc {i}".encode(), f"Doc {i} v2".encode()) for i in range(2)]
+
 
 def test_upload_document_with_version_info(client: TestClient, test_user_token: str, test_project: Project):
     """Test uploading a document creates version 1."""
@@ -50,8 +55,7 @@ def test_upload_document_with_version_info(client: TestClient, test_user_token:
 def test_upload_new_version(client: TestClient, test_user_token: str, test_project: Project):
     """Test uploading a new version of a document."""
     # First upload original document
-    test_file_content = b"Original content"
-    test_file = ("test.txt", test_file_content, "text/plain")
+    test_file = ("test.txt", ORIGINAL_CONTENT, "text/plain")
     
     response = client.post(
         "/documents/upload",
@@ -101,7 +105,7 @@ def test_upload_new_version(client: TestClient, test_user_token: str, test_proje
 def test_get_document_versions(client: TestClient, test_user_token: str, test_project: Project):
     """Test retrieving all versions of a document."""
     # Create document with multiple versions
-    test_file = ("test.txt", b"Version 1", "text/plain")
+    test_file = ("test.txt", VERSION_CONTENT[1], "text/plain")
     
     # Upload original
     response = client.post(
@@ -113,9 +117,10 @@ def test_get_document_versions(client: TestClient, test_user_token: str, test_pr
     
     doc_id = response.json()["id"]
     
-    # Upload two more versions
+    # Upload two more versions one at a time: each new version number is
+    # derived from the current latest, so concurrent uploads would race
     for i in range(2, 4):
-        new_file = ("test.txt", f"Version {i}".encode(), "text/plain")
+        new_file = ("test.txt", VERSION_CONTENT[i], "text/plain")
         client.post(
             f"/documents/{doc_id}/versions",
             headers={"Authorization": f"Bearer {test_user_token}"},
@@ -141,8 +146,7 @@ def test_get_document_versions(client: TestClient, test_user_token: str, test_pr
 def test_restore_document_version(client: TestClient, test_user_token: str, test_project: Project):
     """Test restoring an old version of a document."""
     # Create document with versions
-    original_content = b"Original content"
-    test_file = ("test.txt", original_content, "text/plain")
+    test_file = ("test.txt", ORIGINAL_CONTENT, "text/plain")
     
     response = client.post(
         "/documents/upload",
@@ -181,7 +185,7 @@ def test_restore_document_version(client: TestClient, test_user_token: str, test
     )
     
     assert download_response.status_code == 200
-    assert download_response.content == original_content
+    assert download_response.content == ORIGINAL_CONTENT
 
 
 def test_delete_document_cascade(client: TestClient, test_user_token: str, test_project: Project):
@@ -226,8 +230,8 @@ def test_delete_document_cascade(client: TestClient, test_user_token: str, test_
 def test_filter_latest_documents(client: TestClient, test_user_token: str, test_project: Project):
     """Test filtering for only latest versions of documents."""
     # Create multiple documents with versions
-    for i in range(2):
-        test_file = ("test.txt", f"Doc {i}".encode(), "text/plain")
+    for i, (content, v2_content) in enumerate(DOC_CONTENT):
+        test_file = ("test.txt", content, "text/plain")
         
         response = client.post(
             "/documents/upload",
@@ -242,7 +246,7 @@ def test_filter_latest_documents(client: TestClient, test_user_token: str, test_
         client.post(
             f"/documents/{doc_id}/versions",
             headers={"Authorization": f"Bearer {test_user_token}"},
-            files={"file": ("test.txt", f"Doc {i} v2".encode(), "text/plain")}
+            files={"file": ("test.txt", v2_content, "text/plain")}
         )
     
     # Get only latest versions
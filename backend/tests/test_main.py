@@ -5,4 +5,12 @@ def test_root(client):
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
-    assert response.json()["message"] == "Welcome to LabWeave API"
\ No newline at end of file
+    assert response.json()["message"] == "Welcome to LabWeave API"
+
+
+def test_healthz(client):
+    """Test health endpoint reports Neo4j reachability."""
+    response = client.get("/healthz")
+    # Neo4j might not be running in test environment
+    assert response.status_code in (200, 503)
+    assert response.json()["neo4j_connected"] is (response.status_code == 200)
@@ -0,0 +1,60 @@
+"""Test project endpoints."""
+from src.models.project import Project
+from src.models.user import User
+
+
+def _owner(db):
+    owner = User(email="owner@example.com", username="owner", hashed_password="hashedpw")
+    db.add(owner)
+    db.commit()
+    return owner
+
+
+def test_create_project_status(client, db):
+    """Test that create accepts the frontend's statuses and rejects unknown ones."""
+    owner = _owner(db)
+    
+    response = client.post(
+        "/api/v1/projects/",
+        json={"name": "Planned", "status": "planning", "owner_id": owner.id}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "planning"
+    
+    response = client.post(
+        "/api/v1/projects/",
+        json={"name": "Bogus", "status": "bogus", "owner_id": owner.id}
+    )
+    assert response.status_code == 422
+
+
+def test_read_project_with_legacy_status(client, db):
+    """Test that stored statuses outside the input set still serialize."""
+    owner = _owner(db)
+    project = Project(name="Legacy", status="legacy_state", owner_id=owner.id)
+    db.add(project)
+    db.commit()
+    
+    response = client.get(f"/api/v1/projects/{project.id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "legacy_state"
+    
+    response = client.get("/api/v1/projects/")
+    assert response.status_code == 200
+    assert [p["status"] for p in response.json()] == ["legacy_state"]
+
+
+def test_empty_update_project(client, db):
+    """Test that an empty PATCH returns the project without touching it."""
+    owner = _owner(db)
+    project = Project(name="Unchanged", owner_id=owner.id)
+    db.add(project)
+    db.commit()
+    
+    before = client.get(f"/api/v1/projects/{project.id}")
+    response = client.patch(f"/api/v1/projects/{project.id}", json={})
+    assert response.status_code == 200
+    assert response.json() == before.json()
+    
+    response = client.patch("/api/v1/projects/999999", json={})
+    assert response.status_code == 404
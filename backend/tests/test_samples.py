@@ -0,0 +1,24 @@
+"""Test sample endpoints."""
+from src.models.sample import Sample
+from src.schemas.sample import SampleUpdate
+
+
+def _route_endpoint(app, name):
+    return next(route.endpoint for route in app.routes if getattr(route, "name", None) == name)
+
+
+def test_update_ignores_fields_without_columns(app, db):
+    """Test that PATCH drops schema fields the model has no column for."""
+    sample = Sample(name="Sample", sample_type="soil")
+    db.add(sample)
+    db.commit()
+    
+    update_sample = _route_endpoint(app, "update_sample")
+    item = update_sample(
+        item_update=SampleUpdate(name="Renamed", storage_location="Freezer A"),
+        obj_id=sample.id,
+        db=db,
+    )
+    
+    assert item.name == "Renamed"
+    assert item.location is None
@@ -0,0 +1,18 @@
+"""Test shared schema helpers."""
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.schemas.project import Project
+
+
+def test_from_orm_fast_uses_field_defaults():
+    """Test that attributes missing from the row take the field's default."""
+    now = datetime(2024, 1, 1)
+    row = SimpleNamespace(id=1, name="Partial", owner_id=1, created_at=now, updated_at=now)
+    
+    project = Project.from_orm_fast(row)
+    
+    assert project.name == "Partial"
+    assert project.description is None
+    assert project.status == "active"
+    assert project.extra_metadata is None
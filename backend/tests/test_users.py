@@ -1,4 +1,6 @@
 """Test user endpoints."""
+from sqlalchemy import insert
+
 from src.models.user import User
 
 
@@ -23,22 +25,90 @@ def test_create_user(client, db):
 
 def test_read_users(client, db):
     """Test reading users."""
-    # Create test users
-    test_user1 = User(
-        email="user1@example.com",
-        username="user1",
-        hashed_password="hashedpw1"
-    )
-    test_user2 = User(
-        email="user2@example.com",
-        username="user2",
-        hashed_password="hashedpw2"
-    )
-    db.add_all([test_user1, test_user2])
+    # Create test users with one executemany INSERT, bypassing the unit of work
+    db.execute(insert(User), [
+        {"email": "user1@example.com", "username": "user1", "hashed_password": "hashedpw1"},
+        {"email": "user2@example.com", "username": "user2", "hashed_password": "hashedpw2"},
+    ])
     db.commit()
     
     response = client.get("/api/v1/users/")
     
     assert response.status_code == 200
     data = response.json()
-    assert len(data) == 2
\ No newline at end of file
+    assert len(data) == 2
+
+
+def test_delete_user(client, db):
+    """Test deleting a user and deleting a missing user."""
+    test_user = User(
+        email="gone@example.com",
+        username="gone",
+        hashed_password="hashedpw"
+    )
+    db.add(test_user)
+    db.commit()
+    user_id = test_user.id
+    
+    response = client.delete(f"/api/v1/users/{user_id}")
+    assert response.status_code == 200
+    assert response.json()["detail"] == "User deleted successfully"
+    
+    response = client.delete(f"/api/v1/users/{user_id}")
+    assert response.status_code == 404
+
+
+def test_read_user_etag(client, db):
+    """Test that a matching If-None-Match returns 304 Not Modified."""
+    test_user = User(
+        email="cached@example.com",
+        username="cached",
+        hashed_password="hashedpw"
+    )
+    db.add(test_user)
+    db.commit()
+    
+    response = client.get(f"/api/v1/users/{test_user.id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    
+    response = client.get(
+        f"/api/v1/users/{test_user.id}",
+        headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    
+    strong = etag.removeprefix("W/")
+    for header in (f'"stale", {strong}', "*"):
+        response = client.get(
+            f"/api/v1/users/{test_user.id}",
+            headers={"If-None-Match": header}
+        )
+        assert response.status_code == 304
+    
+    response = client.get(
+        f"/api/v1/users/{test_user.id}",
+        headers={"If-None-Match": 'W/"stale"'}
+    )
+    assert response.status_code == 200
+
+
+def test_empty_update_user_keeps_etag(client, db):
+    """Test that an empty PATCH leaves the user, and its ETag, unchanged."""
+    test_user = User(
+        email="steady@example.com",
+        username="steady",
+        hashed_password="hashedpw"
+    )
+    db.add(test_user)
+    db.commit()
+    
+    etag = client.get(f"/api/v1/users/{test_user.id}").headers["etag"]
+    response = client.patch(f"/api/v1/users/{test_user.id}", json={})
+    assert response.status_code == 200
+    assert client.get(f"/api/v1/users/{test_user.id}").headers["etag"] == etag
+    
+    response = client.patch("/api/v1/users/999999", json={})
+    assert response.status_code == 404